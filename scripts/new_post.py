@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import functools
 import os
 import re
 import sys
@@ -28,12 +29,24 @@ ASCENSION_CONTENT_ROOT = (OPENCLAW_WORKSPACE / "ascension").resolve()
 PUBLIC_TYPES = {"journal", "music_log", "twitter_scroll"}
 PRIVATE_TYPES = {"journal"}
 
+# (visibility, type) -> (template filename, basename prefix, topic)
+POST_KINDS = {
+    ("private", "journal"): ("journal.private.md", "journal", "private_journal"),
+    ("public", "journal"): ("journal.public.md", "ascension_journal", "ascension_journal"),
+    ("public", "music_log"): ("music_log.md", "daily_music_log", "music_log"),
+    ("public", "twitter_scroll"): ("twitter_scroll.md", "ascension_x_scroll", "ascension_x"),
+}
+
+SLUG_INVALID_RE = re.compile(r"[^a-z0-9\s_-]")
+SLUG_SEPARATOR_RE = re.compile(r"[\s_-]+")
+TEMPLATE_TOKENS = ("YYYY-MM-DD", "{{AGENT_NAME}}", "[Topic Name]", "[Month DD, YYYY]", "[HH:MM UTC]")
+TEMPLATE_TOKEN_RE = re.compile("|".join(map(re.escape, TEMPLATE_TOKENS)))
+
 
 def slugify(text: str, max_len: int = 48) -> str:
     value = text.strip().lower()
-    value = re.sub(r"[^a-z0-9\s_-]", "", value)
-    value = re.sub(r"[\s-]+", "_", value)
-    value = re.sub(r"_+", "_", value).strip("_")
+    value = SLUG_INVALID_RE.sub("", value)
+    value = SLUG_SEPARATOR_RE.sub("_", value).strip("_")
     if not value:
         value = "entry"
     return value[:max_len].rstrip("_") or "entry"
@@ -48,52 +61,41 @@ def parse_date(raw: str | None) -> dt.date:
         raise SystemExit(f"Invalid --date '{raw}'. Expected YYYY-MM-DD.") from exc
 
 
-def resolve_template(visibility: str, post_type: str) -> Path:
-    template_map = {
-        ("private", "journal"): "journal.private.md",
-        ("public", "journal"): "journal.public.md",
-        ("public", "music_log"): "music_log.md",
-        ("public", "twitter_scroll"): "twitter_scroll.md",
-    }
-    key = (visibility, post_type)
-    if key not in template_map:
+def lookup_post_kind(visibility: str, post_type: str) -> tuple[str, str, str]:
+    kind = POST_KINDS.get((visibility, post_type))
+    if kind is None:
         raise SystemExit(f"Unsupported combination: visibility={visibility}, type={post_type}")
-    path = TEMPLATES_DIR / template_map[key]
+    return kind
+
+
+def resolve_template(visibility: str, post_type: str) -> Path:
+    template_name, _, _ = lookup_post_kind(visibility, post_type)
+    path = TEMPLATES_DIR / template_name
     if not path.exists():
         raise SystemExit(f"Template not found: {path}")
     return path
 
 
 def build_filename(visibility: str, post_type: str, date: dt.date, title: str) -> tuple[str, str]:
-    date_text = date.isoformat()
+    _, prefix, topic = lookup_post_kind(visibility, post_type)
     slug = slugify(title)
+    return f"{prefix}_{date.isoformat()}_{slug}.{topic}.md", slug
 
-    if visibility == "private" and post_type == "journal":
-        basename = f"journal_{date_text}_{slug}"
-        topic = "private_journal"
-    elif visibility == "public" and post_type == "journal":
-        basename = f"ascension_journal_{date_text}_{slug}"
-        topic = "ascension_journal"
-    elif visibility == "public" and post_type == "music_log":
-        basename = f"daily_music_log_{date_text}_{slug}"
-        topic = "music_log"
-    elif visibility == "public" and post_type == "twitter_scroll":
-        basename = f"ascension_x_scroll_{date_text}_{slug}"
-        topic = "ascension_x"
-    else:
-        raise SystemExit(f"Unsupported combination: visibility={visibility}, type={post_type}")
 
-    return f"{basename}.{topic}.md", slug
+@functools.lru_cache(maxsize=8)
+def load_template(template_path: Path) -> str:
+    return template_path.read_text(encoding="utf-8")
 
 
 def render_template(template_path: Path, date: dt.date, title: str) -> str:
-    content = template_path.read_text(encoding="utf-8")
-    content = content.replace("YYYY-MM-DD", date.isoformat())
-    content = content.replace("{{AGENT_NAME}}", "Ascension")
-    content = content.replace("[Topic Name]", title.strip() or "General")
-    content = content.replace("[Month DD, YYYY]", date.strftime("%B %d, %Y"))
-    content = content.replace("[HH:MM UTC]", dt.datetime.now(dt.timezone.utc).strftime("%H:%M UTC"))
-    return content
+    replacements = {
+        "YYYY-MM-DD": date.isoformat(),
+        "{{AGENT_NAME}}": "Ascension",
+        "[Topic Name]": title.strip() or "General",
+        "[Month DD, YYYY]": date.strftime("%B %d, %Y"),
+        "[HH:MM UTC]": dt.datetime.now(dt.timezone.utc).strftime("%H:%M UTC"),
+    }
+    return TEMPLATE_TOKEN_RE.sub(lambda match: replacements[match.group(0)], load_template(template_path))
 
 
 def parse_args() -> argparse.Namespace:
@@ -57,6 +57,36 @@ def ensure_under(path: Path, base: Path, label: str) -> None:
         raise SystemExit(f"{label} must be under {base}; got {path}")
 
 
+def copy_file(src: Path, dst: Path) -> None:
+    if dst.is_dir():
+        dst = dst / src.name
+    # Same guard as shutil.copy2: opening dst for writing would truncate src.
+    if dst.exists() and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src} and {dst} are the same file")
+    if not hasattr(os, "posix_fadvise") or not hasattr(os, "sendfile"):
+        shutil.copy2(src, dst)
+        return
+
+    with src.open("rb") as fsrc, dst.open("wb") as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(src_fd).st_size
+        os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        try:
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            # sendfile can be unsupported for a given pair (EINVAL, ENOSYS).
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst)
+    shutil.copystat(src, dst)
+
+
 def maybe_open_in_editor(path: Path) -> None:
     editor = os.environ.get("EDITOR")
     if not editor:
@@ -90,7 +120,7 @@ def main() -> int:
         return 0
 
     dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dst)
+    copy_file(src, dst)
 
     print(f"Published locally: {dst}")
     print(f"Private source kept: {src}")
@@ -5,15 +5,24 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import functools
 import hashlib
 import json
 import math
 import os
 import re
+import stat
 import sys
-from dataclasses import dataclass
+import tempfile
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 SKILL_ROOT = Path(__file__).resolve().parents[1]
 
@@ -46,12 +55,37 @@ TOPIC_ALIASES = {
 }
 PAGE_SIZE = 6
 TELEGRAM_CHUNK_SIZE = 3900
-
-
-@dataclass
+POST_ID_VERSION = 2
+MARKDOWN_CACHE_DIR = Path(tempfile.gettempdir()) / (
+    f"ascension_md_cache_{os.getuid()}" if hasattr(os, "getuid") else "ascension_md_cache"
+)
+MARKDOWN_CACHE_VERSION = 1
+MARKDOWN_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+EXCERPT_PREFIX_BYTES = 8192
+
+TITLE_SPLIT_RE = re.compile(r"[_\-\s]+")
+MD_FENCE_RE = re.compile(r"```.*?```", re.S)
+MD_INLINE_CODE_RE = re.compile(r"`([^`]*)`")
+MD_HEADING_RE = re.compile(r"^\s{0,3}#{1,6}\s*", re.M)
+MD_BOLD_RE = re.compile(r"\*\*(.*?)\*\*")
+MD_ITALIC_RE = re.compile(r"\*(.*?)\*")
+MD_LINK_RE = re.compile(r"\[(.*?)\]\(.*?\)")
+MD_BLANK_LINES_RE = re.compile(r"\n{3,}")
+CALLBACK_RE = re.compile(
+    r"ascension:(?:"
+    r"(?P<menu>menu)"
+    r"|topic:(?P<topic>[^:]*)"
+    r"|list:(?P<list_topic>[^:]*):(?P<page>\s*[+-]?\d+\s*)"
+    r"|post:(?P<post_id>[^:]*):(?P<return_page>\s*[+-]?\d+\s*)"
+    r")"
+)
+
+
+@dataclass(slots=True)
 class ContentItem:
     path: Path
     rel_path: Path
+    rel_posix: str
     title: str
     topic: str
     ext: str
@@ -59,40 +93,100 @@ class ContentItem:
     post_id: str
 
 
+@dataclass
+class ContentIndex:
+    items: list[ContentItem] = field(default_factory=list)
+    by_id: dict[str, ContentItem] = field(default_factory=dict)
+    by_topic: dict[str, list[ContentItem]] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+    latest: dict[str, ContentItem] = field(default_factory=dict)
+
+
+@functools.lru_cache(maxsize=64)
+def canonical_topic(raw: str) -> str:
+    topic = raw.strip().lower()
+    return TOPIC_ALIASES.get(topic, topic)
+
+
 def humanize(text: str) -> str:
-    return " ".join(part.capitalize() for part in re.split(r"[_\-\s]+", text.strip()) if part)
+    return " ".join(part.capitalize() for part in TITLE_SPLIT_RE.split(text.strip()) if part)
 
 
 def strip_markdown(text: str) -> str:
-    text = re.sub(r"```.*?```", "", text, flags=re.S)
-    text = re.sub(r"`([^`]*)`", r"\1", text)
-    text = re.sub(r"^\s{0,3}#{1,6}\s*", "", text, flags=re.M)
-    text = re.sub(r"\*\*(.*?)\*\*", r"\1", text)
-    text = re.sub(r"\*(.*?)\*", r"\1", text)
-    text = re.sub(r"\[(.*?)\]\(.*?\)", r"\1", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    # Each pass is skipped when its marker is absent; the `in` checks are
+    # plain memchr-style scans and most posts only use a few constructs.
+    if "`" in text:
+        text = MD_FENCE_RE.sub("", text)
+        text = MD_INLINE_CODE_RE.sub(r"\1", text)
+    if "#" in text:
+        text = MD_HEADING_RE.sub("", text)
+    if "*" in text:
+        text = MD_BOLD_RE.sub(r"\1", text)
+        text = MD_ITALIC_RE.sub(r"\1", text)
+    if "](" in text:
+        text = MD_LINK_RE.sub(r"\1", text)
+    if "\n\n\n" in text:
+        text = MD_BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
 
 
-def parse_item(path: Path, root: Path) -> ContentItem | None:
-    rel_path = path.relative_to(root)
-    parts = path.name.split(".")
-    if len(parts) < 3:
+def make_post_id(rel_posix: str, version: int = POST_ID_VERSION) -> str:
+    data = rel_posix.encode("utf-8")
+    if version == 1:
+        return hashlib.sha1(data).hexdigest()[:12]
+    return hashlib.blake2b(data, digest_size=6).hexdigest()
+
+
+def iter_files(root: Path) -> Iterator[os.DirEntry[str]]:
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return
+
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(Path(entry.path))
+            elif entry.is_file():
+                yield entry
+        except OSError:
+            continue
+
+
+def parse_name(name: str) -> tuple[str, str, str] | None:
+    ext_dot = name.rfind(".")
+    topic_dot = name.rfind(".", 0, ext_dot) if ext_dot > 0 else -1
+    if topic_dot < 0:
         return None
 
-    title_raw = ".".join(parts[:-2])
-    topic = parts[-2].strip().lower()
-    ext = parts[-1].strip().lower()
+    title_raw = name[:topic_dot]
+    topic = name[topic_dot + 1 : ext_dot].strip().lower()
+    ext = name[ext_dot + 1 :].strip().lower()
 
     if not title_raw or not topic or ext not in ALLOWED_EXTENSIONS:
         return None
+    return title_raw, topic, ext
 
-    stat = path.stat()
+
+def parse_item(entry: os.DirEntry[str], root: Path, topics: set[str] | None = None) -> ContentItem | None:
+    parsed = parse_name(entry.name)
+    if parsed is None:
+        return None
+
+    title_raw, topic, ext = parsed
+    if topics is not None and topic not in topics:
+        return None
+
+    stat = entry.stat()
+    path = Path(entry.path)
+    rel_path = path.relative_to(root)
     rel_posix = rel_path.as_posix()
-    post_id = hashlib.sha1(rel_posix.encode("utf-8")).hexdigest()[:12]
+    post_id = make_post_id(rel_posix)
     return ContentItem(
         path=path,
         rel_path=rel_path,
+        rel_posix=rel_posix,
         title=humanize(title_raw),
         topic=topic,
         ext=ext,
@@ -101,57 +195,166 @@ def parse_item(path: Path, root: Path) -> ContentItem | None:
     )
 
 
-def collect_items(root: Path) -> list[ContentItem]:
+def find_topic_for_post_id(root: Path, post_id: str) -> str | None:
+    candidates: list[tuple[str, str]] = []
+    for entry in iter_files(root):
+        parsed = parse_name(entry.name)
+        if parsed is None:
+            continue
+        rel_posix = Path(entry.path).relative_to(root).as_posix()
+        if make_post_id(rel_posix) == post_id:
+            return parsed[1]
+        candidates.append((rel_posix, parsed[1]))
+    # Buttons sent before the post_id switch still carry version 1 ids.
+    if POST_ID_VERSION != 1:
+        for rel_posix, topic in candidates:
+            if make_post_id(rel_posix, version=1) == post_id:
+                return topic
+    return None
+
+
+def build_index(items: list[ContentItem]) -> ContentIndex:
+    index = ContentIndex(items=items)
+    for item in items:
+        index.by_id[item.post_id] = item
+        index.by_topic.setdefault(item.topic, []).append(item)
+    index.counts = {topic: len(topic_items) for topic, topic_items in index.by_topic.items()}
+    index.latest = {topic: topic_items[0] for topic, topic_items in index.by_topic.items()}
+    return index
+
+
+def collect_items(root: Path, topics: set[str] | None = None) -> ContentIndex:
     if not root.exists():
-        return []
+        return ContentIndex()
 
     items: list[ContentItem] = []
-    for path in sorted(root.rglob("*")):
-        if not path.is_file():
-            continue
-        item = parse_item(path, root)
+    # Compare path components, as Path ordering did: "a/x" sorts before "a-b/x".
+    for entry in sorted(iter_files(root), key=lambda e: e.path.split(os.sep)):
+        item = parse_item(entry, root, topics)
         if item:
             items.append(item)
 
     items.sort(key=lambda i: (i.mtime_utc, i.path.name), reverse=True)
-    return items
+    return build_index(items)
 
 
-def topic_count(items: list[ContentItem]) -> dict[str, int]:
-    counts: dict[str, int] = {}
-    for item in items:
-        counts[item.topic] = counts.get(item.topic, 0) + 1
-    return counts
+def topic_count(index: ContentIndex) -> dict[str, int]:
+    return index.counts
 
 
-def latest_for_topic(items: list[ContentItem], topic: str) -> ContentItem | None:
-    for item in items:
-        if item.topic == topic:
-            return item
-    return None
+def latest_for_topic(index: ContentIndex, topic: str) -> ContentItem | None:
+    return index.latest.get(topic)
 
 
-def items_for_topic(items: list[ContentItem], topic: str) -> list[ContentItem]:
-    return [item for item in items if item.topic == topic]
+def items_for_topic(index: ContentIndex, topic: str) -> list[ContentItem]:
+    return index.by_topic.get(topic, [])
 
 
-def find_post_by_id(items: list[ContentItem], post_id: str) -> ContentItem | None:
-    for item in items:
-        if item.post_id == post_id:
-            return item
+def find_post_by_id(index: ContentIndex, post_id: str) -> ContentItem | None:
+    item = index.by_id.get(post_id)
+    if item is not None:
+        return item
+    # Buttons sent before the post_id switch still carry version 1 ids.
+    if POST_ID_VERSION != 1:
+        for item in index.items:
+            if make_post_id(item.rel_posix, version=1) == post_id:
+                return item
     return None
 
 
+def markdown_cache_key(path: Path, stat: os.stat_result) -> str:
+    raw = f"{MARKDOWN_CACHE_VERSION}:{path}:{stat.st_mtime_ns}:{stat.st_size}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def prune_markdown_cache(cache_dir: Path) -> None:
+    cutoff = time.time() - MARKDOWN_CACHE_MAX_AGE
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+    except OSError:
+        pass
+
+
+def markdown_cache_dir() -> Path | None:
+    # The cache lives in shared temp space: only use a real directory that we
+    # own and that no other user can write to or read from.
+    try:
+        MARKDOWN_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        info = os.lstat(MARKDOWN_CACHE_DIR)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(info.st_mode) or info.st_mode & 0o077:
+        return None
+    if hasattr(os, "getuid") and info.st_uid != os.getuid():
+        return None
+    return MARKDOWN_CACHE_DIR
+
+
+def load_cached_plain_text(cache_path: Path) -> str | None:
+    try:
+        return cache_path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def read_plain_text(path: Path, stat: os.stat_result | None = None) -> str:
+    cache_dir = markdown_cache_dir()
+    if cache_dir is None:
+        return strip_markdown(path.read_text(encoding="utf-8"))
+
+    cache_path = cache_dir / markdown_cache_key(path, stat or path.stat())
+    plain = load_cached_plain_text(cache_path)
+    if plain is not None:
+        return plain
+
+    plain = strip_markdown(path.read_text(encoding="utf-8"))
+    try:
+        prune_markdown_cache(cache_dir)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(plain, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return plain
+
+
+def read_excerpt_source(path: Path, max_chars: int) -> str:
+    stat = path.stat()
+    if stat.st_size <= EXCERPT_PREFIX_BYTES:
+        return read_plain_text(path, stat)
+
+    cache_dir = markdown_cache_dir()
+    if cache_dir is not None:
+        cached = load_cached_plain_text(cache_dir / markdown_cache_key(path, stat))
+        if cached is not None:
+            return cached
+
+    with path.open("rb") as handle:
+        raw = handle.read(EXCERPT_PREFIX_BYTES)
+    # Cut at the last newline so no line-level markup or UTF-8 sequence is
+    # split, translate newlines as read_text() would, and only trust the
+    # prefix when every fence and, outside fences, every inline backtick
+    # pair is closed.
+    head = raw[: raw.rfind(b"\n") + 1].decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    if head.count("```") % 2 == 0 and MD_FENCE_RE.sub("", head).count("`") % 2 == 0:
+        plain = strip_markdown(head)
+        if len(plain) > max_chars:
+            return plain
+    return read_plain_text(path, stat)
+
+
 def read_excerpt(path: Path, max_chars: int = 420) -> str:
-    body = path.read_text(encoding="utf-8")
-    plain = strip_markdown(body)
+    plain = read_excerpt_source(path, max_chars)
     if len(plain) <= max_chars:
         return plain
     return plain[: max_chars - 1].rstrip() + "…"
 
 
 def read_full_content(path: Path) -> str:
-    return strip_markdown(path.read_text(encoding="utf-8"))
+    return read_plain_text(path)
 
 
 def paginate(items: list[ContentItem], page: int, page_size: int) -> tuple[list[ContentItem], int, int]:
@@ -168,31 +371,37 @@ def split_text_for_telegram(text: str, chunk_size: int = TELEGRAM_CHUNK_SIZE) ->
     if len(text) <= chunk_size:
         return [text]
 
+    # Walk offsets into the original string instead of re-slicing the
+    # remainder each round, so long posts are not copied once per chunk.
     chunks: list[str] = []
-    rest = text
-    while len(rest) > chunk_size:
-        split_at = rest.rfind("\n", 0, chunk_size)
-        if split_at <= 0:
-            split_at = chunk_size
-        chunk = rest[:split_at].rstrip()
+    start = 0
+    end = len(text)
+    while end - start > chunk_size:
+        limit = start + chunk_size
+        split_at = text.rfind("\n", start, limit)
+        if split_at <= start:
+            split_at = limit
+        chunk = text[start:split_at].rstrip()
         if not chunk:
-            chunk = rest[:chunk_size]
-            split_at = chunk_size
+            chunk = text[start:limit]
+            split_at = limit
         chunks.append(chunk)
-        rest = rest[split_at:].lstrip("\n")
-    if rest:
-        chunks.append(rest)
+        start = split_at
+        while start < end and text[start] == "\n":
+            start += 1
+    if start < end:
+        chunks.append(text[start:])
     return chunks
 
 
-def menu_payload(items: list[ContentItem]) -> dict[str, Any]:
-    counts = topic_count(items)
+def menu_payload(index: ContentIndex) -> dict[str, Any]:
+    counts = topic_count(index)
     lines = ["Ascension topics"]
     keyboard: list[list[dict[str, str]]] = []
 
     for topic, label in TOPIC_LABELS.items():
         count = counts.get(topic, 0)
-        latest = latest_for_topic(items, topic)
+        latest = latest_for_topic(index, topic)
         latest_label = latest.mtime_utc.date().isoformat() if latest else "none"
         lines.append(f"- {label}: {count} posts (latest {latest_label})")
         keyboard.append(
@@ -211,10 +420,10 @@ def menu_payload(items: list[ContentItem]) -> dict[str, Any]:
 
 
 def topic_list_payload(
-    items: list[ContentItem], topic: str, page: int = 1, page_size: int = PAGE_SIZE
+    index: ContentIndex, topic: str, page: int = 1, page_size: int = PAGE_SIZE
 ) -> dict[str, Any]:
     label = TOPIC_LABELS.get(topic, humanize(topic))
-    topic_items = items_for_topic(items, topic)
+    topic_items = items_for_topic(index, topic)
     if not topic_items:
         return {
             "text": f"No public {label.lower()} content available yet.",
@@ -266,8 +475,8 @@ def topic_list_payload(
     }
 
 
-def post_payload(items: list[ContentItem], post_id: str, return_page: int = 1) -> dict[str, Any]:
-    item = find_post_by_id(items, post_id)
+def post_payload(index: ContentIndex, post_id: str, return_page: int = 1) -> dict[str, Any]:
+    item = find_post_by_id(index, post_id)
     if not item:
         return {
             "text": "Post not found.",
@@ -279,13 +488,13 @@ def post_payload(items: list[ContentItem], post_id: str, return_page: int = 1) -
     text = (
         f"Title: {item.title}\n"
         f"Updated: {stamp}\n"
-        f"Path: ascension/public/{item.rel_path.as_posix()}\n\n"
+        f"Path: ascension/public/{item.rel_posix}\n\n"
         f"{body}"
     )
     chunks = split_text_for_telegram(text)
     
     # Get current page for navigation
-    topic_items = items_for_topic(items, item.topic)
+    topic_items = items_for_topic(index, item.topic)
     current_index = topic_items.index(item)
     current_page = (current_index // PAGE_SIZE) + 1
     total_pages = (len(topic_items) + PAGE_SIZE - 1) // PAGE_SIZE
@@ -316,9 +525,9 @@ def post_payload(items: list[ContentItem], post_id: str, return_page: int = 1) -
     return {"messages": messages}
 
 
-def latest_payload(items: list[ContentItem], topic: str) -> dict[str, Any]:
+def latest_payload(index: ContentIndex, topic: str) -> dict[str, Any]:
     label = TOPIC_LABELS.get(topic, humanize(topic))
-    item = latest_for_topic(items, topic)
+    item = latest_for_topic(index, topic)
     if not item:
         return {
             "text": f"No public {label.lower()} content available yet.",
@@ -331,7 +540,7 @@ def latest_payload(items: list[ContentItem], topic: str) -> dict[str, Any]:
         f"Ascension {label}\n"
         f"Title: {item.title}\n"
         f"Updated: {stamp}\n"
-        f"Path: ascension/public/{item.rel_path.as_posix()}\n\n"
+        f"Path: ascension/public/{item.rel_posix}\n\n"
         f"{excerpt}"
     )
 
@@ -345,68 +554,69 @@ def latest_payload(items: list[ContentItem], topic: str) -> dict[str, Any]:
     }
 
 
+def write_json(payload: dict[str, Any]) -> None:
+    if orjson is None:
+        print(json.dumps(payload, ensure_ascii=True, indent=2))
+        return
+
+    data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def format_message(message: dict[str, Any], out: list[str]) -> None:
+    out.append(f"{message.get('text', '')}\n")
+    markup = message.get("reply_markup", {})
+    inline_keyboard = markup.get("inline_keyboard", [])
+    if inline_keyboard:
+        out.append("\nButtons:\n")
+        out.extend(
+            f"- {button['text']} => {button['callback_data']}\n" for row in inline_keyboard for button in row
+        )
+
+
 def print_payload(payload: dict[str, Any], output_format: str) -> int:
     if output_format == "json":
-        print(json.dumps(payload, ensure_ascii=True, indent=2))
+        write_json(payload)
         return 0
 
+    out: list[str] = []
     messages = payload.get("messages")
     if isinstance(messages, list):
         for index, message in enumerate(messages, start=1):
-            print(f"[Message {index}]")
-            print(message.get("text", ""))
-            markup = message.get("reply_markup", {})
-            inline_keyboard = markup.get("inline_keyboard", [])
-            if inline_keyboard:
-                print("\nButtons:")
-                for row in inline_keyboard:
-                    for button in row:
-                        print(f"- {button['text']} => {button['callback_data']}")
+            out.append(f"[Message {index}]\n")
+            format_message(message, out)
             if index != len(messages):
-                print()
-        return 0
-
-    print(payload.get("text", ""))
-    markup = payload.get("reply_markup", {})
-    inline_keyboard = markup.get("inline_keyboard", [])
-    if inline_keyboard:
-        print("\nButtons:")
-        for row in inline_keyboard:
-            for button in row:
-                print(f"- {button['text']} => {button['callback_data']}")
+                out.append("\n")
+    else:
+        format_message(payload, out)
+    sys.stdout.write("".join(out))
     return 0
 
 
 def resolve_callback_action(data: str) -> tuple[str, Any] | None:
-    data = data.strip()
-    if data == "ascension:menu":
-        return ("menu",)
-
-    parts = data.split(":")
-    if len(parts) < 3 or parts[0] != "ascension":
+    match = CALLBACK_RE.fullmatch(data.strip())
+    if not match:
         return None
 
-    if parts[1] == "topic" and len(parts) == 3:
-        topic = TOPIC_ALIASES.get(parts[2].strip().lower(), parts[2].strip().lower())
-        return ("list", topic, 1)
+    if match.group("menu"):
+        return ("menu",)
 
-    if parts[1] == "list" and len(parts) == 4:
-        topic = TOPIC_ALIASES.get(parts[2].strip().lower(), parts[2].strip().lower())
-        try:
-            page = int(parts[3].strip())
-        except ValueError:
-            return None
-        return ("list", topic, max(1, page))
+    topic = match.group("topic")
+    if topic is not None:
+        return ("list", canonical_topic(topic), 1)
 
-    if parts[1] == "post" and len(parts) == 4:
-        post_id = parts[2].strip().lower()
-        try:
-            return_page = int(parts[3].strip())
-        except ValueError:
-            return None
-        return ("post", post_id, max(1, return_page))
+    topic = match.group("list_topic")
+    if topic is not None:
+        return ("list", canonical_topic(topic), max(1, int(match.group("page"))))
 
-    return None
+    post_id = match.group("post_id").strip().lower()
+    return ("post", post_id, max(1, int(match.group("return_page"))))
 
 
 def parse_args() -> argparse.Namespace:
@@ -445,31 +655,35 @@ def main() -> int:
         else DEFAULT_PUBLIC_ROOT
     )
 
-    items = collect_items(content_root)
-
     if args.command == "menu":
-        return print_payload(menu_payload(items), args.format)
+        return print_payload(menu_payload(collect_items(content_root)), args.format)
 
     if args.command == "latest":
-        topic = TOPIC_ALIASES.get(args.topic.strip().lower(), args.topic.strip().lower())
-        return print_payload(latest_payload(items, topic), args.format)
+        topic = canonical_topic(args.topic)
+        index = collect_items(content_root, {topic})
+        return print_payload(latest_payload(index, topic), args.format)
 
     if args.command == "list":
-        topic = TOPIC_ALIASES.get(args.topic.strip().lower(), args.topic.strip().lower())
-        return print_payload(topic_list_payload(items, topic, page=max(1, args.page)), args.format)
+        topic = canonical_topic(args.topic)
+        index = collect_items(content_root, {topic})
+        return print_payload(topic_list_payload(index, topic, page=max(1, args.page)), args.format)
 
     if args.command == "callback":
         action = resolve_callback_action(args.data)
         if action is None:
             return print_payload({"text": "Unknown callback action."}, args.format)
         if action[0] == "menu":
-            return print_payload(menu_payload(items), args.format)
+            return print_payload(menu_payload(collect_items(content_root)), args.format)
         if action[0] == "list":
             _, topic, page = action
-            return print_payload(topic_list_payload(items, topic, page=page), args.format)
+            index = collect_items(content_root, {topic})
+            return print_payload(topic_list_payload(index, topic, page=page), args.format)
         if action[0] == "post":
             _, post_id, return_page = action
-            return print_payload(post_payload(items, post_id, return_page=return_page), args.format)
+            # Only the post's own topic is needed for its navigation buttons.
+            topic = find_topic_for_post_id(content_root, post_id)
+            index = collect_items(content_root, {topic}) if topic else ContentIndex()
+            return print_payload(post_payload(index, post_id, return_page=return_page), args.format)
         return print_payload({"text": "Unknown callback action."}, args.format)
 
     raise SystemExit(f"Unhandled command: {args.command}")
@@ -0,0 +1,30 @@
+import functools
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+TEMPLATES_DIR = REPO_ROOT / "templates"
+
+DUAL_LAYER_REQUIRED = (
+    "Private-Critical Reason:",
+    "Disclosure State:",
+    "Evidence Anchors:",
+    "Raw Core:",
+    "Why It Matters:",
+    "Do-Not-Distort:",
+    "Boundary:",
+    "Quality bar:",
+    "Admission gate:",
+    "Routing rule:",
+    "intimate",
+    "no entry cap",
+)
+DUAL_LAYER_FORBIDDEN = (
+    "Entry Type:",
+    "Pattern/Private Thought:",
+    "1-2 sentences max",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def load_template(name: str) -> str:
+    return (TEMPLATES_DIR / name).read_text(encoding="utf-8")
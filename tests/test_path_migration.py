@@ -13,21 +13,20 @@ from scripts import telegram_delivery as telegram_script
 class PathMigrationTests(unittest.TestCase):
     def test_module_constants_follow_resolved_workspace(self):
         workspace = new_post_script.resolve_workspace_root()
-        self.assertEqual(new_post_script.OPENCLAW_WORKSPACE, new_post_script.resolve_workspace_root())
+        self.assertEqual(new_post_script.OPENCLAW_WORKSPACE, workspace)
         self.assertEqual(new_post_script.ASCENSION_CONTENT_ROOT, workspace / "ascension")
         self.assertEqual(telegram_script.DEFAULT_PUBLIC_ROOT, workspace / "ascension" / "public")
 
-    def test_workspace_priority_ascension_then_openclaw(self):
-        with patch.dict(os.environ, {"ASCENSION_WORKSPACE": "/tmp/ascension_ws", "OPENCLAW_WORKSPACE": "/tmp/openclaw_ws"}, clear=False):
-            self.assertEqual(new_post_script.resolve_workspace_root(), Path("/tmp/ascension_ws").resolve())
-            self.assertEqual(publish_script.resolve_workspace_root(), Path("/tmp/ascension_ws").resolve())
-            self.assertEqual(telegram_script.resolve_workspace_root(), Path("/tmp/ascension_ws").resolve())
-
-    def test_workspace_falls_back_to_openclaw_env(self):
-        with patch.dict(os.environ, {"OPENCLAW_WORKSPACE": "/tmp/openclaw_ws"}, clear=True):
-            self.assertEqual(new_post_script.resolve_workspace_root(), Path("/tmp/openclaw_ws").resolve())
-            self.assertEqual(publish_script.resolve_workspace_root(), Path("/tmp/openclaw_ws").resolve())
-            self.assertEqual(telegram_script.resolve_workspace_root(), Path("/tmp/openclaw_ws").resolve())
+    def test_workspace_resolution_order(self):
+        cases = (
+            ({"ASCENSION_WORKSPACE": "/tmp/ascension_ws", "OPENCLAW_WORKSPACE": "/tmp/openclaw_ws"}, "/tmp/ascension_ws"),
+            ({"OPENCLAW_WORKSPACE": "/tmp/openclaw_ws"}, "/tmp/openclaw_ws"),
+        )
+        for env, raw_expected in cases:
+            expected = Path(raw_expected).resolve()
+            with self.subTest(env=env), patch.dict(os.environ, env, clear=True):
+                for module in (new_post_script, publish_script, telegram_script):
+                    self.assertEqual(module.resolve_workspace_root(), expected)
 
     def test_publish_content_paths_fail_public_root_check(self):
         resolved = publish_script.resolve_input_path("content/public/example.md", kind="public")
@@ -0,0 +1,49 @@
+import errno
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from scripts import publish as publish_script
+
+
+class CopyFileTests(unittest.TestCase):
+    def test_hardlinked_pair_is_rejected_without_truncating_source(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / "src.md"
+            dst = Path(tmp) / "dst.md"
+            src.write_text("keep me", encoding="utf-8")
+            os.link(src, dst)
+
+            with self.assertRaises(shutil.SameFileError):
+                publish_script.copy_file(src, dst)
+            self.assertEqual(src.read_text(encoding="utf-8"), "keep me")
+
+    def test_directory_destination_copies_into_it(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / "src.md"
+            public = Path(tmp) / "public"
+            public.mkdir()
+            src.write_text("body", encoding="utf-8")
+
+            publish_script.copy_file(src, public)
+            self.assertEqual((public / "src.md").read_text(encoding="utf-8"), "body")
+
+    @unittest.skipUnless(hasattr(os, "sendfile"), "sendfile not available")
+    def test_sendfile_failure_falls_back_to_buffered_copy(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / "src.md"
+            dst = Path(tmp) / "dst.md"
+            src.write_bytes(b"body\n" * 1000)
+
+            with patch.object(publish_script.os, "sendfile", side_effect=OSError(errno.EINVAL, "Invalid argument")):
+                publish_script.copy_file(src, dst)
+            self.assertEqual(dst.read_bytes(), src.read_bytes())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,13 +2,32 @@ import json
 import unittest
 from pathlib import Path
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+EXPECTED_COMMAND = {
+    "command": "ascension",
+    "handler": "scripts/telegram_delivery.py",
+    "args": ["menu", "--format", "json"],
+}
+EXPECTED_CALLBACK = {
+    "prefix": "ascension:",
+    "handler": "scripts/telegram_delivery.py",
+    "args": ["callback", "--data", "{callback_data}", "--format", "json"],
+}
+
 
 class SkillManifestTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.manifest_path = REPO_ROOT / "skill.json"
+        cls.manifest = (
+            json.loads(cls.manifest_path.read_text(encoding="utf-8")) if cls.manifest_path.exists() else None
+        )
+
     def test_skill_manifest_has_openclaw_telegram_wiring(self):
-        manifest_path = Path(__file__).resolve().parents[1] / "skill.json"
-        self.assertTrue(manifest_path.exists(), "skill.json must exist at repository root")
+        self.assertTrue(self.manifest_path.exists(), "skill.json must exist at repository root")
 
-        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        manifest = self.manifest
         self.assertEqual(manifest.get("name"), "ascension")
 
         telegram_commands = manifest.get("telegramCommands")
@@ -16,21 +35,14 @@ class SkillManifestTests(unittest.TestCase):
         self.assertGreaterEqual(len(telegram_commands), 1)
 
         command = telegram_commands[0]
-        self.assertEqual(command.get("command"), "ascension")
-        self.assertEqual(command.get("handler"), "scripts/telegram_delivery.py")
-        self.assertEqual(command.get("args"), ["menu", "--format", "json"])
+        self.assertEqual({key: command.get(key) for key in EXPECTED_COMMAND}, EXPECTED_COMMAND)
 
         callback_handlers = manifest.get("callbackHandlers")
         self.assertIsInstance(callback_handlers, list)
         self.assertGreaterEqual(len(callback_handlers), 1)
 
         callback = callback_handlers[0]
-        self.assertEqual(callback.get("prefix"), "ascension:")
-        self.assertEqual(callback.get("handler"), "scripts/telegram_delivery.py")
-        self.assertEqual(
-            callback.get("args"),
-            ["callback", "--data", "{callback_data}", "--format", "json"],
-        )
+        self.assertEqual({key: callback.get(key) for key in EXPECTED_CALLBACK}, EXPECTED_CALLBACK)
 
 
 if __name__ == "__main__":
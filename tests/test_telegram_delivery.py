@@ -1,5 +1,10 @@
+import io
+import json
+import os
 import tempfile
 import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
 from pathlib import Path
 import sys
 
@@ -8,56 +13,65 @@ from scripts import telegram_delivery as td
 
 
 class TelegramDeliveryTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Read-only paginated fixtures shared by the tests that never modify them.
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls.journal_root = Path(tmp.name) / "journal"
+        cls.journal_root.mkdir()
+        cls.create_posts(
+            cls.journal_root,
+            [(f"post-{i+1}", "ascension_journal", f"Body {i+1}", 1_700_000_000 + i) for i in range(7)],
+        )
+        cls.music_root = Path(tmp.name) / "music"
+        cls.music_root.mkdir()
+        cls.create_posts(
+            cls.music_root,
+            [(f"item-{i+1}", "music_log", f"Music {i+1}", 1_700_001_000 + i) for i in range(7)],
+        )
+
+    def setUp(self):
+        # Keep every test away from the real cache in shared temp space.
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = Path(tmp.name) / "cache"
+        patcher = patch.object(td, "MARKDOWN_CACHE_DIR", self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def create_post(self, root: Path, name: str, topic: str, body: str, ts: int) -> Path:
-        path = root / f"{name}.{topic}.md"
-        path.write_text(body, encoding="utf-8")
-        path.touch()
-        path.chmod(0o644)
-        path_stat = path.stat()
-        # Preserve atime while setting deterministic mtime.
-        path_atime = path_stat.st_atime
-        path_mtime = ts
-        import os
-
-        os.utime(path, (path_atime, path_mtime))
-        return path
+        return self.create_posts(root, [(name, topic, body, ts)])[0]
+
+    @staticmethod
+    def create_posts(root: Path, specs: list[tuple[str, str, str, int]]) -> list[Path]:
+        paths = []
+        for name, topic, body, ts in specs:
+            path = root / f"{name}.{topic}.md"
+            path.write_text(body, encoding="utf-8")
+            ts_ns = ts * 1_000_000_000
+            os.utime(path, ns=(ts_ns, ts_ns))
+            paths.append(path)
+        return paths
 
     def test_topic_callback_opens_paginated_list(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            base_ts = 1_700_000_000
-            for i in range(7):
-                self.create_post(
-                    root,
-                    f"post-{i+1}",
-                    "ascension_journal",
-                    f"Body {i+1}",
-                    base_ts + i,
-                )
-
-            items = td.collect_items(root)
-            action = td.resolve_callback_action("ascension:topic:journal")
-            self.assertEqual(action, ("list", "ascension_journal", 1))
-
-            payload = td.topic_list_payload(items, "ascension_journal", page=1)
-            self.assertIn("Page 1/2", payload["text"])
-            rows = payload["reply_markup"]["inline_keyboard"]
-            self.assertEqual(len(rows[0:6]), 6)
-            self.assertIn("ascension:list:ascension_journal:2", str(rows))
+        index = td.collect_items(self.journal_root)
+        action = td.resolve_callback_action("ascension:topic:journal")
+        self.assertEqual(action, ("list", "ascension_journal", 1))
 
-    def test_second_page_has_remaining_posts(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            root = Path(tmp)
-            base_ts = 1_700_001_000
-            for i in range(7):
-                self.create_post(root, f"item-{i+1}", "music_log", f"Music {i+1}", base_ts + i)
+        payload = td.topic_list_payload(index, "ascension_journal", page=1)
+        self.assertIn("Page 1/2", payload["text"])
+        rows = payload["reply_markup"]["inline_keyboard"]
+        self.assertEqual(len(rows[0:6]), 6)
+        self.assertIn("ascension:list:ascension_journal:2", str(rows))
 
-            items = td.collect_items(root)
-            payload = td.topic_list_payload(items, "music_log", page=2)
-            self.assertIn("Page 2/2", payload["text"])
-            self.assertIn("1.", payload["text"])
-            rows = payload["reply_markup"]["inline_keyboard"]
-            self.assertEqual(rows[0][0]["text"].split(".")[0], "1")
+    def test_second_page_has_remaining_posts(self):
+        index = td.collect_items(self.music_root)
+        payload = td.topic_list_payload(index, "music_log", page=2)
+        self.assertIn("Page 2/2", payload["text"])
+        self.assertIn("1.", payload["text"])
+        rows = payload["reply_markup"]["inline_keyboard"]
+        self.assertEqual(rows[0][0]["text"].split(".")[0], "1")
 
     def test_post_payload_returns_full_content_for_selected_post(self):
         with tempfile.TemporaryDirectory() as tmp:
@@ -65,27 +79,167 @@ class TelegramDeliveryTests(unittest.TestCase):
             self.create_post(root, "alpha", "ascension_x", "Line A\nLine B", 1_700_002_000)
             self.create_post(root, "beta", "ascension_x", "Line C\nLine D", 1_700_002_100)
 
-            items = td.collect_items(root)
-            selected = next(item for item in items if item.title == "Alpha")
-            payload = td.post_payload(items, selected.post_id, return_page=1)
+            index = td.collect_items(root)
+            by_title = {item.title: item for item in index.items}
+            self.assertCountEqual(by_title, ["Alpha", "Beta"])
+            selected = by_title["Alpha"]
+            payload = td.post_payload(index, selected.post_id, return_page=1)
 
             self.assertIn("Title: Alpha", payload["text"])
             self.assertIn("Line A", payload["text"])
             self.assertIn("Path: ascension/public/alpha.ascension_x.md", payload["text"])
             self.assertIn("ascension:list:ascension_x:1", str(payload["reply_markup"]))
 
+    def test_post_payload_accepts_legacy_post_id(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self.create_post(root, "alpha", "ascension_x", "Line A", 1_700_002_000)
+
+            index = td.collect_items(root)
+            legacy_id = td.make_post_id("alpha.ascension_x.md", version=1)
+            self.assertNotEqual(index.items[0].post_id, legacy_id)
+            self.assertIs(td.find_post_by_id(index, legacy_id), index.items[0])
+
     def test_long_post_splits_into_messages_envelope(self):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp)
-            long_body = "x" * 9000
-            self.create_post(root, "long", "ascension_journal", long_body, 1_700_003_000)
-            items = td.collect_items(root)
+            path = root / "long.ascension_journal.md"
+            path.write_bytes(b"x" * 9000)
+            os.utime(path, ns=(1_700_003_000_000_000_000, 1_700_003_000_000_000_000))
+            index = td.collect_items(root)
 
-            payload = td.post_payload(items, items[0].post_id, return_page=1)
+            payload = td.post_payload(index, index.items[0].post_id, return_page=1)
             self.assertIn("messages", payload)
             self.assertGreater(len(payload["messages"]), 1)
             self.assertIn("reply_markup", payload["messages"][-1])
 
+    def test_collect_items_walks_subdirectories(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "nested").mkdir()
+            self.create_post(root, "top", "music_log", "Top", 1_700_005_000)
+            self.create_post(root / "nested", "deep", "music_log", "Deep", 1_700_005_100)
+            (root / "cover.png").write_bytes(b"\x89PNG")
+            (root / "notes.md").write_text("no topic", encoding="utf-8")
+
+            index = td.collect_items(root)
+            self.assertEqual([item.title for item in index.items], ["Deep", "Top"])
+            self.assertEqual(index.items[0].rel_posix, "nested/deep.music_log.md")
+
+    def test_same_mtime_tie_breaks_by_path_components(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for name in ("a-b", "a"):
+                (root / name).mkdir()
+                self.create_post(root / name, "x", "music_log", name, 1_700_005_200)
+
+            index = td.collect_items(root)
+            self.assertEqual(td.latest_for_topic(index, "music_log").rel_posix, "a/x.music_log.md")
+
+    def test_post_lookup_collects_only_its_topic(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self.create_post(root, "song", "music_log", "Song", 1_700_007_000)
+            self.create_post(root, "scroll", "ascension_x", "Scroll", 1_700_007_100)
+
+            post_id = td.make_post_id("song.music_log.md")
+            topic = td.find_topic_for_post_id(root, post_id)
+            self.assertEqual(topic, "music_log")
+            self.assertIsNone(td.find_topic_for_post_id(root, "000000000000"))
+            legacy_id = td.make_post_id("song.music_log.md", version=1)
+            self.assertEqual(td.find_topic_for_post_id(root, legacy_id), "music_log")
+
+            index = td.collect_items(root, {topic})
+            self.assertEqual([item.title for item in index.items], ["Song"])
+            self.assertIn("Title: Song", td.post_payload(index, post_id)["text"])
+
+    def test_full_content_cache_invalidates_on_change(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            path = self.create_post(root, "cached", "ascension_journal", "# Heading\n**Bold**", 1_700_006_000)
+            self.assertEqual(td.read_full_content(path), "Heading\nBold")
+            self.assertEqual(len(list(self.cache_dir.iterdir())), 1)
+
+            self.create_post(root, "cached", "ascension_journal", "Changed", 1_700_006_100)
+            self.assertEqual(td.read_full_content(path), "Changed")
+
+    def test_shared_cache_dir_is_ignored(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self.create_post(Path(tmp), "shared", "ascension_journal", "# Real", 1_700_006_200)
+            self.cache_dir.mkdir()
+            self.cache_dir.chmod(0o777)
+            planted = self.cache_dir / td.markdown_cache_key(path, path.stat())
+            planted.write_text("Planted", encoding="utf-8")
+
+            self.assertIsNone(td.markdown_cache_dir())
+            self.assertEqual(td.read_full_content(path), "Real")
+            self.assertEqual(list(self.cache_dir.iterdir()), [planted])
+
+    def test_large_post_excerpt_matches_full_strip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            bodies = {
+                "plain": "# Heading\n**Bold** intro\n" + "filler line\n" * 800,
+                "fenced": "```\na`b\n```\nintro `c\n" + "filler line\n" * 800 + "end`",
+                "crlf": "# Heading\r\n\r\n\r\n\r\nIntro para\r\n" + "filler line\r\n" * 800,
+            }
+            for name, body in bodies.items():
+                with self.subTest(name=name):
+                    path = root / f"{name}.ascension_journal.md"
+                    path.write_bytes(body.encode("utf-8"))
+                    self.assertGreater(path.stat().st_size, td.EXCERPT_PREFIX_BYTES)
+                    plain = td.strip_markdown(path.read_text(encoding="utf-8"))
+                    self.assertEqual(td.read_excerpt(path), plain[:419].rstrip() + "…")
+
+    def capture_output(self, payload: dict, output_format: str) -> str:
+        stream = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        with redirect_stdout(stream):
+            td.print_payload(payload, output_format)
+        stream.flush()
+        return stream.buffer.getvalue().decode("utf-8")
+
+    @unittest.skipIf(td.orjson is None, "orjson not installed")
+    def test_json_output_matches_without_orjson(self):
+        index = td.collect_items(self.journal_root)
+        payload = td.post_payload(index, index.items[0].post_id)
+        payload["text"] += "\nÜber “quotes” …"
+        fast = self.capture_output(payload, "json")
+        with patch.object(td, "orjson", None):
+            fallback = self.capture_output(payload, "json")
+        self.assertEqual(json.loads(fast), json.loads(fallback))
+        self.assertEqual(json.loads(fast), payload)
+
+    def test_text_output_lists_messages_and_buttons(self):
+        back = {"text": "Back", "callback_data": "ascension:menu"}
+        single = {"text": "Only", "reply_markup": {"inline_keyboard": [[back]]}}
+        self.assertEqual(self.capture_output(single, "text"), "Only\n\nButtons:\n- Back => ascension:menu\n")
+
+        envelope = {
+            "messages": [
+                {"text": "Part one"},
+                {"text": "Part two", "reply_markup": {"inline_keyboard": [[back, {"text": "Next", "callback_data": "n"}]]}},
+            ]
+        }
+        self.assertEqual(
+            self.capture_output(envelope, "text"),
+            "[Message 1]\nPart one\n\n"
+            "[Message 2]\nPart two\n\nButtons:\n- Back => ascension:menu\n- Next => n\n",
+        )
+
+    def test_callback_actions(self):
+        cases = (
+            ("ascension:menu", ("menu",)),
+            ("ascension:topic:", ("list", "", 1)),
+            ("ascension:list:music: 2 ", ("list", "music_log", 2)),
+            ("ascension:list:music_log:+4", ("list", "music_log", 4)),
+            ("ascension:list:x:-3", ("list", "ascension_x", 1)),
+            ("ascension:post:ABCDEF012345:0", ("post", "abcdef012345", 1)),
+            ("ascension:post:abcdef012345", None),
+        )
+        for callback, expected in cases:
+            with self.subTest(callback=callback):
+                self.assertEqual(td.resolve_callback_action(callback), expected)
+
     def test_invalid_callback_returns_none(self):
         self.assertIsNone(td.resolve_callback_action("ascension:unknown"))
         self.assertIsNone(td.resolve_callback_action("ascension:list:music:not-a-number"))
@@ -94,9 +248,9 @@ class TelegramDeliveryTests(unittest.TestCase):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp)
             self.create_post(root, "entry", "ascension_journal", "First line\nSecond line", 1_700_004_000)
-            items = td.collect_items(root)
+            index = td.collect_items(root)
 
-            payload = td.latest_payload(items, "ascension_journal")
+            payload = td.latest_payload(index, "ascension_journal")
             text = payload["text"]
             self.assertIn("Ascension Journal\nTitle:", text)
             self.assertIn("Path: ascension/public/entry.ascension_journal.md", text)